@@ -27,6 +27,97 @@ from .planner_agent import PlannerAgent
 from services.review_service import ReviewService
 
 
+# --- Display cleanup patterns (compiled once, used on every streamed message) ---
+# Technical tags and [DONE] are dropped, handoff cues become @ mentions - all in one pass
+_CUE_MENTIONS = {
+    "SENIOR": "@Senior Dev",
+    "JUNIOR": "@Junior Dev",
+    "TESTER": "@Unit Tester",
+    "RESEARCH": "@Researcher",
+}
+_SCRUB_RE = re.compile(
+    r'\[(?:File (?:Edit|Create|Delete): |SEARCH:|FILE_SEARCH:|READ_FILE:|EDIT_FILE:|CREATE_FILE:|DELETE_FILE:|READ_URL:|SUB_RESEARCH:)[^\]]+\]'
+    r'|\[DONE\]'
+    r'|\[→(?P<role>SENIOR|JUNIOR|TESTER|RESEARCH)\]'
+)
+_GHOST_PUNCT_RE = re.compile(r'(\w)\s+([.,!?;:])')
+_TRAILING_COLON_RE = re.compile(r'[:\s]+$')
+_INLINE_CODE_PUNCT_RE = re.compile(r'(`)\s*([.,!?;:])')
+_CODE_PUNCT_RE = re.compile(r'(```)\s*[.,!?;:]\s*')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+_MULTI_SPACE_RE = re.compile(r' {2,}')
+
+
+def _scrub_replacement(match: re.Match) -> str:
+    role = match.group('role')
+    return _CUE_MENTIONS[role] if role else ''
+
+
+def _compile_report_headers() -> List[tuple]:
+    """(plain header, markdown header, loose pattern, tight pattern, replacement) for each premium report header"""
+    header_map = {
+        "Analysis Summary": "### 🧠 Analysis Summary",
+        "Key Technical Insights": "### 💡 Key Technical Insights",
+        "Recommendations": "### 🎯 Recommendations",
+        "Source Verification": "### 🔗 Source Verification"
+    }
+    compiled = []
+    for plain_header, markdown_header in header_map.items():
+        compiled.append((
+            plain_header,
+            markdown_header,
+            re.compile(r'(?i)([^\n])\s*(?:###\s*)?(?:[🧠💡🎯🔗]\s*)?' + re.escape(plain_header)),
+            re.compile(r'([^\n])\n' + re.escape(markdown_header)),
+            r'\1\n\n' + markdown_header
+        ))
+    return compiled
+
+
+_REPORT_HEADERS = _compile_report_headers()
+
+
+# --- Cue extraction patterns ---
+# Every bracketed cue is found in one finditer pass. The lookahead only consumes the '[',
+# so a cue nested inside another cue's argument is still picked up.
+# Handoff cue -> agent name; the handoff alternation in _CUE_RE is built from its keys
+_CUE_TO_AGENT = {
+    "SENIOR": "Senior Dev",
+    "JUNIOR": "Junior Dev",
+    "TESTER": "Unit Tester",
+    "RESEARCH": "Researcher",
+    "RESEARCHER": "Researcher",
+    "LEAD": "Research Lead",
+    "SEARCH": "Search",
+    "FILE_SEARCH": "FileSearch"
+}
+_CUE_KINDS = (
+    "EDIT_FILE", "CREATE_FILE", "SEARCH", "FILE_SEARCH", "DELETE_FILE", "READ_FILE",
+    "READ_URL", "SUB_RESEARCH", "RUN_COMMAND", "RUN_TESTS",
+)
+_CUE_LABELS = {"EDIT_FILE": "EDIT", "CREATE_FILE": "CREATE", "DELETE_FILE": "DELETE", "READ_FILE": "READ"}
+_CUE_QUOTED_ARGS = frozenset({"SEARCH", "READ_URL", "SUB_RESEARCH"})
+_CUE_STRIPPED_ARGS = frozenset({"FILE_SEARCH", "RUN_COMMAND", "RUN_TESTS"})
+_CUE_RE = re.compile(
+    r'\[(?='
+    r'→(?P<handoff>' + '|'.join(_CUE_TO_AGENT) + r')\]'
+    r'|(?P<kind>' + '|'.join(_CUE_KINDS) + r'):(?P<arg>[^\]]+)\]'
+    r'|(?P<flag>DONE|PROJECT_COMPLETE)\]'
+    r')'
+)
+_MENTION_RE = re.compile(r'(@(Senior|Junior|Tester|Researcher)(?:\s*Dev)?)', re.IGNORECASE)
+
+# --- File edit extraction patterns ---
+_EDIT_CUE_RE = re.compile(r'\[(EDIT|CREATE)_FILE:([^\]]+)\]')
+_CODE_BLOCK_RE = re.compile(r'```(?:\w+)?\n(.*?)\n```', re.DOTALL)
+_DELETE_CUE_RE = re.compile(r'\[DELETE_FILE:([^\]]+)\]')
+
+# --- Mission checklist patterns (parsed from every agent turn) ---
+_MISSION_CHECKLIST_RE = re.compile(r'\[MISSION_CHECKLIST\](.*?)\[/MISSION_CHECKLIST\]', re.DOTALL)
+_CHECKLIST_ITEM_RE = re.compile(r'-\s*\[([ x])\]\s*(\d+)\.\s*(.+?)(?:\s*\(→(\w+)\))?$')
+_CHECKLIST_UPDATE_RE = re.compile(r'\[CHECKLIST_UPDATE\](.*?)\[/CHECKLIST_UPDATE\]', re.DOTALL)
+_CHECKLIST_DONE_ITEM_RE = re.compile(r'-\s*\[(x)\]\s*(\d+)\.\s*(.+)')
+
+
 @dataclass
 class Message:
     """Represents a message in the conversation"""
@@ -43,16 +134,7 @@ class AgentOrchestrator:
     """Orchestrates multi-agent conversations"""
     
     # Agent cue mapping
-    CUE_TO_AGENT = {
-        "SENIOR": "Senior Dev",
-        "JUNIOR": "Junior Dev",
-        "TESTER": "Unit Tester",
-        "RESEARCH": "Researcher",
-        "RESEARCHER": "Researcher",
-        "LEAD": "Research Lead",
-        "SEARCH": "Search",
-        "FILE_SEARCH": "FileSearch"
-    }
+    CUE_TO_AGENT = _CUE_TO_AGENT
     
     def __init__(self, file_manager=None, scraper=None, usage_tracker=None, terminal_manager=None, rating_service=None):
         self.file_manager = file_manager
@@ -319,8 +401,7 @@ class AgentOrchestrator:
         - [ ] 2. Step two (→AGENT)
         [/MISSION_CHECKLIST]
         """
-        pattern = r'\[MISSION_CHECKLIST\](.*?)\[/MISSION_CHECKLIST\]'
-        match = re.search(pattern, content, re.DOTALL)
+        match = _MISSION_CHECKLIST_RE.search(content)
         
         if not match:
             return False
@@ -340,7 +421,7 @@ class AgentOrchestrator:
                 continue
             
             # Parse checklist items: - [ ] 1. Description (→AGENT)
-            item_match = re.match(r'-\s*\[([ x])\]\s*(\d+)\.\s*(.+?)(?:\s*\(→(\w+)\))?$', line)
+            item_match = _CHECKLIST_ITEM_RE.match(line)
             if item_match:
                 done = item_match.group(1) == 'x'
                 step_num = int(item_match.group(2))
@@ -373,8 +454,7 @@ class AgentOrchestrator:
         - [x] 2. Step description
         [/CHECKLIST_UPDATE]
         """
-        pattern = r'\[CHECKLIST_UPDATE\](.*?)\[/CHECKLIST_UPDATE\]'
-        matches = re.findall(pattern, content, re.DOTALL)
+        matches = _CHECKLIST_UPDATE_RE.findall(content)
         
         updates_applied = 0
         
@@ -383,7 +463,7 @@ class AgentOrchestrator:
             for line in lines:
                 line = line.strip()
                 # Parse: - [x] 2. Description
-                item_match = re.match(r'-\s*\[(x)\]\s*(\d+)\.\s*(.+)', line)
+                item_match = _CHECKLIST_DONE_ITEM_RE.match(line)
                 if item_match:
                     step_num = int(item_match.group(2))
                     
@@ -470,119 +550,56 @@ class AgentOrchestrator:
     def _extract_cues(self, content: str) -> List[str]:
         """Extract cues from agent response, respecting their order of appearance"""
         cue_hits = []
-        
-        # 1. Find explicit handoff tags [→AGENT]
-        for cue_name in self.CUE_TO_AGENT.keys():
-            pattern = re.escape(f"[→{cue_name}]")
-            for match in re.finditer(pattern, content):
-                cue_hits.append((match.start(), cue_name))
+        # [DONE] / [PROJECT_COMPLETE] are ordered by their last occurrence
+        last_flags = {}
+        
+        # 1. Bracketed cues: handoff tags [→AGENT], [KIND:arg] actions and completion flags
+        if '[' in content:
+            for match in _CUE_RE.finditer(content):
+                handoff, kind, flag = match.group('handoff', 'kind', 'flag')
+                if handoff:
+                    cue_hits.append((match.start(), handoff))
+                elif kind:
+                    arg = match.group('arg')
+                    if kind in _CUE_QUOTED_ARGS:
+                        arg = arg.strip().strip('"').strip("'")
+                    elif kind in _CUE_STRIPPED_ARGS:
+                        arg = arg.strip()
+                    cue_hits.append((match.start(), f"{_CUE_LABELS.get(kind, kind)}:{arg}"))
+                else:
+                    last_flags[flag] = match.start()
         
         # 2. Find @mentions as accidental handoffs
-        mention_pattern = r'(@(Senior|Junior|Tester|Researcher)(?:\s*Dev)?)'
-        for match in re.finditer(mention_pattern, content, re.IGNORECASE):
-            full_mention = match.group(1)
-            agent_found = match.group(2).upper()
-            
-            # Check context: Is this just a thank you?
-            context_before = content[max(0, match.start() - 20):match.start()].lower()
-            if any(keyword in context_before for keyword in ["thanks", "thank", "great work", "good job", "excellent"]):
-                print(f"👋 [Orchestrator] Ignoring thank-you mention of {agent_found}")
-                continue
+        if '@' in content:
+            for match in _MENTION_RE.finditer(content):
+                agent_found = match.group(2).upper()
+                
+                # Check context: Is this just a thank you?
+                context_before = content[max(0, match.start() - 20):match.start()].lower()
+                if any(keyword in context_before for keyword in ["thanks", "thank", "great work", "good job", "excellent"]):
+                    print(f"👋 [Orchestrator] Ignoring thank-you mention of {agent_found}")
+                    continue
 
-            if agent_found in self.CUE_TO_AGENT:
-                cue_hits.append((match.start(), agent_found))
-        
-        # 3. Find file edit cues
-        edit_pattern = r'\[EDIT_FILE:([^\]]+)\]'
-        for match in re.finditer(edit_pattern, content):
-            path = match.group(1)
-            cue_hits.append((match.start(), f"EDIT:{path}"))
-        
-        create_pattern = r'\[CREATE_FILE:([^\]]+)\]'
-        for match in re.finditer(create_pattern, content):
-            path = match.group(1)
-            cue_hits.append((match.start(), f"CREATE:{path}"))
-
-        # 4. Find search cues
-        search_pattern = r'\[SEARCH:([^\]]+)\]'
-        for match in re.finditer(search_pattern, content):
-            query = match.group(1).strip().strip('"').strip("'")
-            cue_hits.append((match.start(), f"SEARCH:{query}"))
-
-        # 5. Find file search cues
-        file_search_pattern = r'\[FILE_SEARCH:([^\]]+)\]'
-        for match in re.finditer(file_search_pattern, content):
-            pattern = match.group(1).strip()
-            cue_hits.append((match.start(), f"FILE_SEARCH:{pattern}"))
-
-        # 6. Find file delete cues
-        delete_pattern = r'\[DELETE_FILE:([^\]]+)\]'
-        for match in re.finditer(delete_pattern, content):
-            path = match.group(1)
-            cue_hits.append((match.start(), f"DELETE:{path}"))
-
-        # 7. Find file read cues
-        read_pattern = r'\[READ_FILE:([^\]]+)\]'
-        for match in re.finditer(read_pattern, content):
-            path = match.group(1)
-            cue_hits.append((match.start(), f"READ:{path}"))
-
-        # 8. Find web read cues
-        web_read_pattern = r'\[READ_URL:([^\]]+)\]'
-        for match in re.finditer(web_read_pattern, content):
-            url = match.group(1).strip().strip('"').strip("'")
-            cue_hits.append((match.start(), f"READ_URL:{url}"))
-
-        # 9. Find sub-research cues (Deep Research)
-        sub_research_pattern = r'\[SUB_RESEARCH:([^\]]+)\]'
-        for match in re.finditer(sub_research_pattern, content):
-            query = match.group(1).strip().strip('"').strip("'")
-            cue_hits.append((match.start(), f"SUB_RESEARCH:{query}"))
-
-        # 10. Find run command cues
-        run_command_pattern = r'\[RUN_COMMAND:([^\]]+)\]'
-        for match in re.finditer(run_command_pattern, content):
-            cmd = match.group(1).strip()
-            cue_hits.append((match.start(), f"RUN_COMMAND:{cmd}"))
-
-        # 11. Find run tests cues
-        run_tests_pattern = r'\[RUN_TESTS:([^\]]+)\]'
-        for match in re.finditer(run_tests_pattern, content):
-            cmd = match.group(1).strip()
-            cue_hits.append((match.start(), f"RUN_TESTS:{cmd}"))
-
-        # 12. Check for DONE cue
-        if "[DONE]" in content:
-            pos = content.rfind("[DONE]")
-            cue_hits.append((pos, "DONE"))
-        
-        # 11. Check for PROJECT_COMPLETE cue
-        if "[PROJECT_COMPLETE]" in content:
-            pos = content.rfind("[PROJECT_COMPLETE]")
-            cue_hits.append((pos, "PROJECT_COMPLETE"))
+                if agent_found in self.CUE_TO_AGENT:
+                    cue_hits.append((match.start(), agent_found))
+        
+        cue_hits.extend((pos, flag) for flag, pos in last_flags.items())
 
         # Sort all found cues by their start position in the text
         cue_hits.sort(key=lambda x: x[0])
         
         # Return unique cues in order of appearance
-        final_cues = []
-        for _, cue in cue_hits:
-            if cue not in final_cues:
-                final_cues.append(cue)
-        
-        return final_cues
+        return list(dict.fromkeys(cue for _, cue in cue_hits))
     
     def _extract_code_block(self, content: str, start_index: int = 0) -> Optional[tuple[str, int, int]]:
         """
         Extract the first code block from content starting at start_index.
         Returns: (code_content, start_pos, end_pos) or None
         """
-        pattern = r'```(?:\w+)?\n(.*?)\n```'
-        match = re.search(pattern, content[start_index:], re.DOTALL)
+        # Search in place from start_index (offsets are absolute, no tail copy)
+        match = _CODE_BLOCK_RE.search(content, start_index)
         if match:
-            code_start = start_index + match.start()
-            code_end = start_index + match.end()
-            return match.group(1).strip(), code_start, code_end
+            return match.group(1).strip(), match.start(), match.end()
         return None
 
     def _extract_all_edits(self, full_response: str) -> List[dict]:
@@ -590,9 +607,9 @@ class AgentOrchestrator:
         Find all file cues and associate them with their respective code blocks.
         """
         edits = []
-        # Find all EDIT/CREATE cues with their positions
-        cue_pattern = r'\[(EDIT|CREATE)_FILE:([^\]]+)\]'
-        for match in re.finditer(cue_pattern, full_response):
+        # Find all EDIT/CREATE cues with their positions (one pass)
+        cue_matches = list(_EDIT_CUE_RE.finditer(full_response))
+        for i, match in enumerate(cue_matches):
             action = match.group(1).lower()
             path = match.group(2)
             cue_end = match.end()
@@ -601,9 +618,10 @@ class AgentOrchestrator:
             extracted = self._extract_code_block(full_response, cue_end)
             if extracted:
                 code_content, block_start, block_end = extracted
-                # Only associate if there isn't another cue between this one and the block
-                next_cue = re.search(cue_pattern, full_response[cue_end:block_start])
-                if not next_cue:
+                # Only associate if there isn't another cue between this one and the block.
+                # Cues don't overlap, so that is exactly "the next cue ends before the block".
+                next_cue = cue_matches[i + 1] if i + 1 < len(cue_matches) else None
+                if next_cue is None or next_cue.end() > block_start:
                     edits.append({
                         "action": action,
                         "path": path,
@@ -615,60 +633,67 @@ class AgentOrchestrator:
                     })
         return edits
     
+    @staticmethod
+    def _apply_replacements(text: str, replacements: List[Dict]) -> str:
+        """
+        Swap each {"start", "end", "text"} range of text for its placeholder.
+        Single forward sweep over the original offsets; a range nested in one
+        already replaced (e.g. a DELETE cue inside a code block) is skipped.
+        """
+        parts = []
+        pos = 0
+        for r in sorted(replacements, key=lambda x: x["start"]):
+            if r["start"] < pos:
+                continue
+            parts.append(text[pos:r["start"]])
+            parts.append(r["text"])
+            pos = r["end"]
+        parts.append(text[pos:])
+        return "".join(parts)
+    
     def _clean_message_for_display(self, message: str) -> str:
         """
         Clean up technical cues and placeholders for user-friendly display.
         """
         
         # 1. Remove all internal cues and technical tags
-        message = re.sub(r'\[(?:File (?:Edit|Create|Delete): |SEARCH:|FILE_SEARCH:|READ_FILE:|EDIT_FILE:|CREATE_FILE:|DELETE_FILE:|READ_URL:|SUB_RESEARCH:)[^\]]+\]', '', message)
-        message = message.replace("[DONE]", "")
-        
         # 2. Convert agent handoff cues to @ mentions
-        cue_to_mention = {
-            r'\[→SENIOR\]': '@Senior Dev',
-            r'\[→JUNIOR\]': '@Junior Dev', 
-            r'\[→TESTER\]': '@Unit Tester',
-            r'\[→RESEARCH\]': '@Researcher',
-        }
-        for cue_pattern, mention in cue_to_mention.items():
-            message = re.sub(cue_pattern, mention, message)
+        # Every cue starts with '[', so plain prose skips the regex entirely
+        if '[' in message:
+            message = _SCRUB_RE.sub(_scrub_replacement, message)
         
         # 3. Clean up "ghost" artifacts
         # Attaches punctuation to preceding words (word . -> word.)
-        message = re.sub(r'(\w)\s+([.,!?;:])', r'\1\2', message)
+        message = _GHOST_PUNCT_RE.sub(r'\1\2', message)
         
         # Remove trailing colons/whitespace only at the ABSOLUTE END of the message
-        message = re.sub(r'[:\s]+$', '', message)
+        message = _TRAILING_COLON_RE.sub('', message)
         
         # 4. Header Protection Logic for Premium Reports
-        header_map = {
-            "Analysis Summary": "### 🧠 Analysis Summary",
-            "Key Technical Insights": "### 💡 Key Technical Insights",
-            "Recommendations": "### 🎯 Recommendations",
-            "Source Verification": "### 🔗 Source Verification"
-        }
-        
-        for plain_header, markdown_header in header_map.items():
+        # Literal prefilter: ASCII text can only match a header it contains case-insensitively
+        # (non-ASCII text always runs the regexes, since IGNORECASE folds some non-ASCII letters)
+        folded = message.lower() if message.isascii() else None
+        for plain_header, markdown_header, loose_re, tight_re, replacement in _REPORT_HEADERS:
             # Match any character followed by the header, fixing missing newlines/markings
-            pattern = r'(?i)([^\n])\s*(?:###\s*)?(?:[🧠💡🎯🔗]\s*)?' + re.escape(plain_header)
-            message = re.sub(pattern, r'\1\n\n' + markdown_header, message)
+            if folded is None or plain_header.lower() in folded:
+                message = loose_re.sub(replacement, message)
             
             # Ensure correct double newline even if structure is mostly correct
-            correct_pattern = r'([^\n])\n' + re.escape(markdown_header)
-            message = re.sub(correct_pattern, r'\1\n\n' + markdown_header, message)
+            if markdown_header in message:
+                message = tight_re.sub(replacement, message)
         
         # 5. Fix punctuation spacing around code blocks and inlines
-        # Inline code: Keep but attach (e.g. `code` . -> `code`.)
-        message = re.sub(r'(`)\s*([.,!?;:])', r'\1\2', message)
-        
-        # Block code: Strip trailing punctuation and replace with newline (satisfies legacy tests)
-        # This turns ```...```, into ```\n
-        message = re.sub(r'(```)\s*[.,!?;:]\s*', r'\1\n', message)
+        if '`' in message:
+            # Inline code: Keep but attach (e.g. `code` . -> `code`.)
+            message = _INLINE_CODE_PUNCT_RE.sub(r'\1\2', message)
+            
+            # Block code: Strip trailing punctuation and replace with newline (satisfies legacy tests)
+            # This turns ```...```, into ```\n
+            message = _CODE_PUNCT_RE.sub(r'\1\n', message)
         
         # 6. Final whitespace normalization
-        message = re.sub(r'\n{3,}', '\n\n', message)
-        message = re.sub(r' {2,}', ' ', message)
+        message = _BLANK_LINES_RE.sub('\n\n', message)
+        message = _MULTI_SPACE_RE.sub(' ', message)
         
         return message.strip()
     
@@ -725,9 +750,6 @@ class AgentOrchestrator:
         Process a message with streaming responses
         Yields events as agents respond and hand off
         """
-        from services.web_scraper import WebScraper
-        scraper = WebScraper()
-        
         # Ensure initialized
         if not self.initialized:
             await self.initialize()
@@ -940,9 +962,12 @@ class AgentOrchestrator:
                 ])
                 turn_context["terminal_context"] = f"Recent Terminal History:\n{history_text}"
             
-            # Collect full response for cue extraction
-            full_response = ""
-            full_thoughts = ""
+            # Collect full response for cue extraction (chunks are joined once the stream ends)
+            response_parts = []
+            thought_parts = []
+            response_tail = ""  # End of the response so far, to spot file cues split across chunks
+            file_cue_seen = False
+            fence_count = 0  # "```" seen so far; odd while a code block is open
             signature = None
             cues = []
             
@@ -979,18 +1004,23 @@ class AgentOrchestrator:
                         self._log_to_file("console", current_agent_name, event_content or event.get("message", ""))
 
                     if event_type == "thought":
-                        full_thoughts += event_content
+                        thought_parts.append(event_content)
                         yield {
                             "type": "thought",
                             "agent": current_agent_name,
                             "content": event_content
                         }
                     elif event_type == "message":
-                        full_response += event_content
+                        response_parts.append(event_content)
+                        fence_count += event_content.count("```")
+                        if not file_cue_seen:
+                            window = response_tail + event_content
+                            file_cue_seen = "[EDIT_FILE:" in window or "[CREATE_FILE:" in window
+                            response_tail = window[-len("[CREATE_FILE:"):]
                         
                         # Heuristic: if we just saw an EDIT/CREATE cue, and this chunk starts a code block,
                         # we start suppressing it from the chat stream.
-                        if (last_was_cue or "[EDIT_FILE:" in full_response or "[CREATE_FILE:" in full_response) and "```" in event_content:
+                        if (last_was_cue or file_cue_seen) and "```" in event_content:
                             suppress_message = True
                             yield {
                                 "type": "agent_status",
@@ -1004,7 +1034,7 @@ class AgentOrchestrator:
                                 "content": event_content
                             }
                         
-                        if "```" in event_content and suppress_message and full_response.count("```") % 2 == 0:
+                        if "```" in event_content and suppress_message and fence_count % 2 == 0:
                             # We closed the code block
                             suppress_message = False
 
@@ -1043,6 +1073,9 @@ class AgentOrchestrator:
                 # Force break loop
                 break
             
+            full_response = "".join(response_parts)
+            full_thoughts = "".join(thought_parts)
+            
             # --- STUCK DETECTION & FALLBACK ---
             # If we exited the loop with NO response and NO thoughts, the agent might be stuck/empty.
             if not full_response.strip() and not full_thoughts.strip() and not cues:
@@ -1216,8 +1249,7 @@ class AgentOrchestrator:
                     file_edit_proposed = True
             
             # Check for deletions separately as they might not have code blocks
-            delete_pattern = r'\[DELETE_FILE:([^\]]+)\]'
-            for match in re.finditer(delete_pattern, full_response):
+            for match in _DELETE_CUE_RE.finditer(full_response):
                 path = match.group(1)
                 change_id = await self.file_manager.create_pending_change(
                     path=path,
@@ -1256,10 +1288,9 @@ class AgentOrchestrator:
             if replacements:
                 # Re-apply replacements to the full response first to get the placeholders
                 # then clean it using the display cleaner
-                temp_clean = full_response
-                for r in replacements:
-                    temp_clean = temp_clean[:r["start"]] + r["text"] + temp_clean[r["end"]:]
-                clean_full_response = self._clean_message_for_display(temp_clean)
+                clean_full_response = self._clean_message_for_display(
+                    self._apply_replacements(full_response, replacements)
+                )
 
             # --- BUG FIX: EMPTY BUBBLE ---
             # If the agent said nothing human-readable but did something (cues),
@@ -1349,25 +1380,27 @@ class AgentOrchestrator:
                 break
 
             # Check for file read cues
-            file_read_path = None
-            for cue in cues:
-                if cue.startswith("READ:"):
-                    file_read_path = cue.split(":", 1)[1]
-                    break
+            file_read_paths = [cue.split(":", 1)[1] for cue in cues if cue.startswith("READ:")]
             
-            if file_read_path:
+            if file_read_paths:
                 yield {
                     "type": "agent_status",
-                    "status": f"Reading file: {file_read_path}..."
+                    "status": f"Reading file: {', '.join(file_read_paths)}..."
                 }
                 
-                # Perform file read
-                file_content = await self.file_manager.read_file(file_read_path)
+                # Perform all file reads concurrently, results come back in cue order
+                file_contents = await asyncio.gather(*(self.file_manager.read_file(p) for p in file_read_paths))
                 
-                if file_content is None:
-                    current_message = f"I tried to read '{file_read_path}' but it doesn't exist or is empty. Please verify the file path."
-                else:
-                    current_message = f"Content of '{file_read_path}':\n\n```\n{file_content}\n```\n\nI have read the file. Please continue with your analysis."
+                read_sections = []
+                for file_read_path, file_content in zip(file_read_paths, file_contents):
+                    if file_content is None:
+                        read_sections.append(f"I tried to read '{file_read_path}' but it doesn't exist or is empty. Please verify the file path.")
+                    else:
+                        read_sections.append(f"Content of '{file_read_path}':\n\n```\n{file_content}\n```")
+                
+                if any(content is not None for content in file_contents):
+                    read_sections.append(f"I have read the file{'s' if len(file_read_paths) > 1 else ''}. Please continue with your analysis.")
+                current_message = "\n\n".join(read_sections)
                 
                 # Continue the loop with the same agent
                 continue
@@ -1481,11 +1514,12 @@ class AgentOrchestrator:
                     })
 
                 # Generate summary for conversation history to ensure context continuity
-                research_summary = f"**Executed Deep Research** on {len(sub_research_queries)} topics. Found {len(all_detailed_contents)} sources:\n\n"
+                summary_lines = [f"**Executed Deep Research** on {len(sub_research_queries)} topics. Found {len(all_detailed_contents)} sources:\n\n"]
                 for i, content in enumerate(all_detailed_contents):
                     title = content.get('title', 'Unknown Source')
                     url = content.get('url', '#')
-                    research_summary += f"{i+1}. [{title}]({url})\n"
+                    summary_lines.append(f"{i+1}. [{title}]({url})\n")
+                research_summary = "".join(summary_lines)
                 
                 # Add to history so it's visible to user/evaluator and next agent
                 self.conversation.append(Message(
@@ -1542,8 +1576,16 @@ class AgentOrchestrator:
                     "status": f"Searching for: {search_query}..."
                 }
                 
-                # Perform search
-                results = await scraper.search_and_summarize(search_query)
+                # Perform search, reusing the shared scraper (and its pooled HTTP client) when one was injected
+                if self.scraper:
+                    results = await self.scraper.search_and_summarize(search_query)
+                else:
+                    from services.web_scraper import WebScraper
+                    scraper = WebScraper()
+                    try:
+                        results = await scraper.search_and_summarize(search_query)
+                    finally:
+                        await scraper.aclose()
                 
                 # Broadcast results to frontend for cards
                 yield {
@@ -1657,10 +1699,11 @@ class AgentOrchestrator:
                     }
                     
                     # Send warning back to agent and continue
-                    current_message = f"⚠️ Cannot mark project complete yet. The following checklist items are not done:\n"
-                    for item in incomplete_items:
-                        current_message += f"- [ ] {item.get('step', '?')}. {item.get('description', '')} (→{item.get('agent', 'SENIOR')})\n"
-                    current_message += "\nPlease complete these remaining steps first."
+                    current_message = "".join([
+                        "⚠️ Cannot mark project complete yet. The following checklist items are not done:\n",
+                        *(f"- [ ] {item.get('step', '?')}. {item.get('description', '')} (→{item.get('agent', 'SENIOR')})\n" for item in incomplete_items),
+                        "\nPlease complete these remaining steps first."
+                    ])
                     
                     # Keep same agent to handle the incomplete work
                     continue
@@ -14,9 +14,10 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, UploadFile, File, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
+import orjson
 
 # Load environment variables
 load_dotenv(Path(__file__).parent.parent / ".env")
@@ -48,6 +49,36 @@ class PollingFilter(logging.Filter):
 # Apply filter to uvicorn access logs
 logging.getLogger("uvicorn.access").addFilter(PollingFilter())
 
+# --- Response Rendering ---
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson, bypassing jsonable_encoder for large payloads"""
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+def _orjson_default(obj):
+    """Serialize the few non-JSON types our payloads carry"""
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+async def _stream_json_sections(sections):
+    """
+    Render a JSON object one top-level key at a time.
+    Each section is built and serialized before its bytes are sent, and a failing
+    section becomes null so the document stays valid once streaming has started.
+    This is an async generator on purpose: the builders read ScoringEngine's caches,
+    which record_score mutates on the event loop, so they must not run in the threadpool.
+    """
+    yield b"{"
+    for i, (key, build) in enumerate(sections):
+        try:
+            value = orjson.dumps(build(), default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+        except Exception as e:
+            print(f"⚠️ [API] Failed to build '{key}' section: {e}")
+            value = b"null"
+        yield (b"," if i else b"") + orjson.dumps(key) + b":" + value
+    yield b"}"
+
 # Helper to detect OS
 IS_WINDOWS = sys.platform == 'win32'
 
@@ -364,6 +395,7 @@ async def lifespan(app: FastAPI):
     print("👋 Shutting down agents and terminals...")
     try:
         orchestrator.stop()
+        await scraper.aclose()
         # Gracefully close all terminal sessions
         client_ids = list(terminal_manager.ptys.keys())
         for cid in client_ids:
@@ -542,14 +574,14 @@ async def terminal_websocket(websocket: WebSocket, shell: Optional[str] = None):
             terminal_manager.active_tasks[client_id].cancel()
         terminal_manager.close_pty(client_id)
 
-@app.get("/files")
+@app.get("/files", response_class=ORJSONResponse)
 async def list_files():
     """List all project files"""
     files = await file_manager.get_directory()
-    return {
+    return ORJSONResponse({
         "files": files,
         "workspace": str(file_manager.workspace_path) if file_manager.workspace_path else None
-    }
+    })
 
 @app.post("/files/upload")
 async def upload_files(files: List[UploadFile] = File(...), path: str = Form(".")):
@@ -818,7 +850,7 @@ async def select_folder():
         
     return {"path": selected_path}
 
-@app.post("/set-workspace")
+@app.post("/set-workspace", response_class=ORJSONResponse)
 async def set_workspace(data: dict):
     path_str = data.get("path")
     if not path_str:
@@ -831,11 +863,11 @@ async def set_workspace(data: dict):
     terminal_manager.sync_workspace(file_manager.workspace_path)
     
     files = await file_manager.get_directory()
-    return {
+    return ORJSONResponse({
         "status": "success", 
         "workspace": str(file_manager.workspace_path),
         "files": files
-    }
+    })
 
 @app.post("/detach-workspace")
 async def detach_workspace():
@@ -897,7 +929,7 @@ async def create_folder(path: str = Form(...)):
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@app.post("/rename")
+@app.post("/rename", response_class=ORJSONResponse)
 async def rename_item(data: dict):
     path = data.get("path")
     new_name = data.get("new_name")
@@ -906,7 +938,7 @@ async def rename_item(data: dict):
     
     try:
         result = await file_manager.rename_item(path, new_name)
-        return result
+        return ORJSONResponse(result)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -923,7 +955,7 @@ async def delete_item(data: dict):
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@app.post("/move")
+@app.post("/move", response_class=ORJSONResponse)
 async def move_item(data: dict):
     source_path = data.get("source_path")
     destination_folder = data.get("destination_folder", "")
@@ -932,7 +964,7 @@ async def move_item(data: dict):
     
     try:
         result = await file_manager.move_item(source_path, destination_folder)
-        return result
+        return ORJSONResponse(result)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -1026,10 +1058,10 @@ class BenchmarkRunRequest(BaseModel):
     suite: str = "all"
     auto_mode: bool = True
 
-@app.get("/api/benchmarks/suites")
+@app.get("/api/benchmarks/suites", response_class=ORJSONResponse)
 async def list_benchmark_suites():
     """List available benchmark suites"""
-    return benchmark_service.list_suites()
+    return ORJSONResponse(benchmark_service.list_suites())
 
 @app.post("/api/benchmarks/run")
 async def run_benchmarks(request: BenchmarkRunRequest):
@@ -1059,15 +1091,18 @@ async def stop_benchmarks():
     benchmark_service.stop()
     return {"status": "stopping", "message": "Benchmark suite stop requested"}
 
-@app.get("/api/benchmarks/status")
+@app.get("/api/benchmarks/status", response_class=ORJSONResponse)
 async def get_benchmark_status():
     """Get status of current benchmark run"""
-    return benchmark_service.get_status()
+    return ORJSONResponse(benchmark_service.get_status())
 
 @app.get("/api/benchmarks/results")
 async def get_benchmark_results(limit: int = 50):
-    """Get all historical benchmark results for charting"""
-    return benchmark_service.get_results(limit=limit)
+    """Get all historical benchmark results for charting (streamed section by section)"""
+    return StreamingResponse(
+        _stream_json_sections(benchmark_service.result_sections(limit=limit)),
+        media_type="application/json"
+    )
 
 @app.get("/api/benchmarks/compare")
 async def compare_benchmark_runs(a: str, b: str):
@@ -0,0 +1,57 @@
+"""
+Stats Kernels
+Numeric helpers for the scoring engine, JIT-compiled with Numba when it is installed.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional - fall back to plain Python with the same results
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def slope_and_stats(x: np.ndarray, y: np.ndarray):
+    """
+    Least-squares line through (x, y) plus summary statistics of y, in one pass.
+
+    Returns:
+        (slope, intercept, mean, stdev, min, max) - stdev is the population stdev
+    """
+    n = len(y)
+    sum_x = 0.0
+    sum_y = 0.0
+    sum_xx = 0.0
+    sum_xy = 0.0
+    lo = y[0]
+    hi = y[0]
+    for i in range(n):
+        sum_x += x[i]
+        sum_y += y[i]
+        sum_xx += x[i] * x[i]
+        sum_xy += x[i] * y[i]
+        if y[i] < lo:
+            lo = y[i]
+        if y[i] > hi:
+            hi = y[i]
+    mean_x = sum_x / n
+    mean_y = sum_y / n
+
+    # Raw-sum form: exact for integer scores over run indices, so a slope sitting
+    # on a classification threshold isn't nudged either way by rounding
+    denom = n * sum_xx - sum_x * sum_x
+    slope = (n * sum_xy - sum_x * sum_y) / denom if denom > 0.0 else 0.0
+    intercept = mean_y - slope * mean_x
+
+    sq_dev = 0.0
+    for i in range(n):
+        dy = y[i] - mean_y
+        sq_dev += dy * dy
+    return slope, intercept, mean_y, math.sqrt(sq_dev / n), lo, hi
@@ -9,7 +9,7 @@ import uuid
 import asyncio
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from services.scoring_engine import ScoringEngine
 
 
@@ -411,12 +411,16 @@ class BenchmarkService:
     
     def get_results(self, limit: int = 50) -> Dict[str, Any]:
         """Get all historical benchmark results for charting"""
-        return {
-            "chart_data": self.scoring_engine.get_chart_data(),
-            "history": self.scoring_engine.get_history(limit=limit),
-            "trend": self.scoring_engine.get_trend(),
-            "agent_summary": self.scoring_engine.get_agent_summary()
-        }
+        return {key: build() for key, build in self.result_sections(limit=limit)}
+    
+    def result_sections(self, limit: int = 50) -> List[Tuple[str, Callable[[], Any]]]:
+        """get_results() as (key, builder) pairs, so callers can compute and send one section at a time"""
+        return [
+            ("chart_data", self.scoring_engine.get_chart_data),
+            ("history", lambda: self.scoring_engine.get_history(limit=limit)),
+            ("trend", self.scoring_engine.get_trend),
+            ("agent_summary", self.scoring_engine.get_agent_summary)
+        ]
     
     def compare(self, run_id_a: str, run_id_b: str) -> Dict[str, Any]:
         """Compare two benchmark runs"""
@@ -47,13 +47,27 @@ class FileManager:
         self.projects_root.mkdir(exist_ok=True)
         
         self.workspace_path = None  # No workspace until user opens a folder
+        # Last set_workspace() argument and what it resolved to, so re-opening it skips the resolve
+        self._input_workspace = None
+        self._resolved_workspace = None
         self.max_file_size = int(os.getenv("MAX_FILE_SIZE_MB", 10)) * 1024 * 1024
         self.pending_changes: Dict[str, PendingChange] = {}
     
     def set_workspace(self, path: Path):
         """Set the workspace to a new absolute path"""
+        if (
+            self._resolved_workspace is not None
+            and path == self._input_workspace
+            and self.workspace_path == self._resolved_workspace
+            and self.workspace_path.is_dir()
+        ):
+            # Same folder re-opened: skip the resolve/mkdir, but still drop stale pending changes
+            self.pending_changes = {}
+            return
+        
         old_path = self.workspace_path
         self.workspace_path = Path(path).resolve()
+        self._input_workspace, self._resolved_workspace = path, self.workspace_path
         # Ensure it exists
         self.workspace_path.mkdir(parents=True, exist_ok=True)
         print(f"📂 [FileManager] Workspace SWITCH: {old_path} -> {self.workspace_path}")
@@ -132,22 +146,15 @@ class FileManager:
             "status": "uploaded"
         }
     
-    async def save_file_from_content(self, path: str, content: str) -> dict:
-        """Create a new file from string content"""
-        file_path = self._sanitize_path(path)
-        
-        # Validate extension
-        if not self._validate_extension(file_path):
-            raise ValueError(f"File type not allowed: {file_path.suffix}")
-        
-        print(f"📂 [FileManager] Creating file at: {file_path}")
-        
-        if file_path.exists() and file_path.is_dir():
+    @staticmethod
+    def _prepare_new_file(path: str, file_path: Path):
+        """Check that file_path can be created and make its parent folders (blocking)"""
+        if file_path.is_dir():
             raise ValueError(f"Cannot create file '{path}': A folder with this name already exists")
 
         # Create parent directories safely
         try:
-            if file_path.parent.exists() and not file_path.parent.is_dir():
+            if file_path.parent.is_file():
                  raise ValueError(f"Cannot create file in '{file_path.parent.name}': It is a file, not a folder")
             
             file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -157,6 +164,19 @@ class FileManager:
             if "Cannot create a file when that file already exists" in str(e):
                 raise ValueError(f"Cannot create folder structure for '{path}'. A file with the same name as a parent folder already exists.")
             raise ValueError(f"System error ensuring folder structure: {e}")
+    
+    async def save_file_from_content(self, path: str, content: str) -> dict:
+        """Create a new file from string content"""
+        file_path = self._sanitize_path(path)
+        
+        # Validate extension
+        if not self._validate_extension(file_path):
+            raise ValueError(f"File type not allowed: {file_path.suffix}")
+        
+        print(f"📂 [FileManager] Creating file at: {file_path}")
+        
+        # Filesystem checks and mkdir share one worker thread so concurrent creates don't block the event loop
+        await asyncio.to_thread(self._prepare_new_file, path, file_path)
         
         # Write content
         try:
@@ -176,7 +196,7 @@ class FileManager:
     async def create_folder(self, path: str) -> dict:
         """Create a new folder"""
         folder_path = self._sanitize_path(path)
-        folder_path.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(folder_path.mkdir, parents=True, exist_ok=True)
         
         return {
             "path": str(folder_path.relative_to(self.workspace_path)).replace("\\", "/"),
@@ -265,6 +285,26 @@ class FileManager:
             "status": "deleted"
         }
     
+    @classmethod
+    def _walk(cls, root: str):
+        """
+        Recursively yield os.DirEntry objects below root (symlinked folders are listed, not entered).
+        Unreadable folders are still yielded but their contents are skipped, like Path.rglob.
+        """
+        try:
+            it = os.scandir(root)
+        except OSError:
+            return
+        with it:
+            for entry in it:
+                yield entry
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    yield from cls._walk(entry.path)
+    
     async def get_directory(self, search_pattern: Optional[str] = None) -> List[dict]:
         """List all files in workspace with optional search pattern (Read Only)"""
         # Return empty list if no workspace is set
@@ -273,30 +313,31 @@ class FileManager:
         
         # Noisy log removed: print(f"🔍 [FileManager] Getting directory for: {self.workspace_path}")
         files = []
+        root = str(self.workspace_path)
+        prefix_len = len(os.path.join(root, ""))
+        needle = search_pattern.lower() if search_pattern else None
         
-        for path in self.workspace_path.rglob("*"):
+        for entry in self._walk(root):
             # Include both files (validated) and directories
-            is_dir = path.is_dir()
-            is_file = path.is_file()
+            is_dir = entry.is_dir()
+            is_file = not is_dir and entry.is_file()
             
-            if (is_file and self._validate_extension(path)) or is_dir:
-                rel_path = str(path.relative_to(self.workspace_path)).replace("\\", "/")
+            if (is_file and self._validate_extension(Path(entry.name))) or is_dir:
+                rel_path = entry.path[prefix_len:].replace("\\", "/")
                 
                 # Filter by search pattern if provided
-                if search_pattern and search_pattern.lower() not in rel_path.lower():
+                if needle and needle not in rel_path.lower():
                     continue
                     
-                stats = path.stat()
+                stats = entry.stat()
                 file_info = {
                     "path": rel_path,
                     "size": stats.st_size if is_file else 0,
                     "modified": datetime.fromtimestamp(stats.st_mtime).isoformat(),
-                    "extension": path.suffix if is_file else None,
+                    "extension": Path(entry.name).suffix if is_file else None,
                     "type": "file" if is_file else "folder"
                 }
                 files.append(file_info)
-                # Verbose logging to catch the "merging" bug
-        pass
         return sorted(files, key=lambda x: x["path"])
     
     async def read_file(self, path: str) -> Optional[str]:
@@ -3,20 +3,36 @@ Scoring Engine
 Robust weighted scoring system with persistence and trend detection.
 """
 
-import json
 import os
 from datetime import datetime
+from decimal import Decimal
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 import statistics
 
+import numpy as np
+import orjson
+
+from services._stats_kernels import slope_and_stats
+
+
+def _default(obj: Any) -> Any:
+    """Serialize the few non-native types orjson rejects"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
 class ScoringEngine:
     """
     Robust scoring system with:
     - Weighted scores per category
     - Per-agent tracking over time
-    - Persistent JSON history
+    - Persistent JSON Lines history (one run per line, append-only)
     - Trend detection (improving/degrading/stable)
     """
     
@@ -27,28 +43,124 @@ class ScoringEngine:
         "terminal_usage": 1.5  # Critical skill, weigh higher
     }
     
+    # Runs kept in history; the file is compacted back to this once it holds twice as many
+    MAX_RUNS = 500
+    
     def __init__(self, data_dir: str = "data"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
-        self.scores_file = self.data_dir / "benchmark_scores.json"
+        self.scores_file = self.data_dir / "benchmark_scores.jsonl"
+        
+        # Parsed scores, reused while the file's (path, mtime, size) is unchanged
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cache_key: Optional[tuple] = None
+        self._stored_runs = 0       # Lines in the file (may exceed MAX_RUNS until compaction)
+        self._needs_rewrite = False  # File had unreadable lines; rewrite instead of appending
         
-        # Ensure file exists
+        # Columnar view of the runs (see _load_columns), rebuilt when the runs change
+        self._columns: Optional[Dict[str, Any]] = None
+        self._columns_source: Optional[Dict[str, Any]] = None
+        
+        # Ensure file exists, migrating the pre-JSONL history if there is one
         if not self.scores_file.exists():
-            with open(self.scores_file, 'w') as f:
-                json.dump({"runs": []}, f)
+            self._save_scores(self._load_legacy_scores())
+    
+    def _file_key(self) -> tuple:
+        """Identity of the scores file on disk; changes whenever it is rewritten"""
+        st = os.stat(self.scores_file)
+        return (str(self.scores_file), st.st_mtime_ns, st.st_size)
+    
+    def _load_legacy_scores(self) -> Dict[str, Any]:
+        """Read the old single-document benchmark_scores.json, if present"""
+        legacy_file = self.data_dir / "benchmark_scores.json"
+        try:
+            with open(legacy_file, 'rb') as f:
+                data = orjson.loads(f.read())
+            print(f"📦 [ScoringEngine] Migrating {legacy_file.name} to {self.scores_file.name}")
+            return {"runs": data.get("runs", [])[-self.MAX_RUNS:]}
+        except (orjson.JSONDecodeError, FileNotFoundError, AttributeError):
+            return {"runs": []}
     
     def _load_scores(self) -> Dict[str, Any]:
-        """Load scores from persistent storage"""
+        """Load scores from persistent storage (cached until the file changes)"""
         try:
-            with open(self.scores_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
+            key = self._file_key()
+            if key == self._cache_key:
+                return self._cache
+            runs = []
+            needs_rewrite = False
+            with open(self.scores_file, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        runs.append(orjson.loads(line))
+                    except orjson.JSONDecodeError:
+                        # e.g. a torn final line from an interrupted write
+                        needs_rewrite = True
+        except FileNotFoundError:
             return {"runs": []}
+        
+        data = {"runs": runs[-self.MAX_RUNS:]}
+        self._stored_runs, self._needs_rewrite = len(runs), needs_rewrite
+        self._cache, self._cache_key = data, key
+        return data
     
     def _save_scores(self, data: Dict[str, Any]):
-        """Save scores to persistent storage"""
-        with open(self.scores_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        """Rewrite the whole scores file (migration and compaction)"""
+        with open(self.scores_file, 'wb') as f:
+            f.writelines(orjson.dumps(run, default=_default) + b"\n" for run in data["runs"])
+        self._stored_runs, self._needs_rewrite = len(data["runs"]), False
+        self._cache, self._cache_key = data, self._file_key()
+        self._columns = None  # `data` may be the same (mutated) dict the columns came from
+    
+    def _append_run(self, run: Dict[str, Any]):
+        """Persist one run by appending a line, without rewriting the history"""
+        data = self._load_scores()
+        data["runs"].append(run)
+        data["runs"] = data["runs"][-self.MAX_RUNS:]
+        
+        if self._cache is not data or self._needs_rewrite or self._stored_runs >= 2 * self.MAX_RUNS:
+            # Missing/damaged file, or time to drop runs past MAX_RUNS
+            self._save_scores(data)
+            return
+        
+        with open(self.scores_file, 'ab') as f:
+            f.write(orjson.dumps(run, default=_default) + b"\n")
+        self._stored_runs += 1
+        self._cache_key = self._file_key()
+        self._columns = None
+    
+    def _load_columns(self) -> Dict[str, Any]:
+        """
+        Struct-of-arrays view of the runs for chart/trend aggregation.
+        
+        Returns:
+            {
+                "labels": [timestamps],
+                "overall": np.ndarray of overall raw scores,
+                "agents": {"Agent Name": np.ndarray of raw scores, NaN where absent}
+            }
+        """
+        data = self._load_scores()
+        if self._columns is not None and self._columns_source is data:
+            return self._columns
+        
+        runs = data.get("runs", [])
+        n = len(runs)
+        labels = [run["timestamp"] for run in runs]
+        overall = np.fromiter((run["overall_raw_score"] for run in runs), dtype=np.float64, count=n)
+        agents: Dict[str, np.ndarray] = {}
+        for i, run in enumerate(runs):
+            for agent, score_data in run.get("agent_scores", {}).items():
+                column = agents.get(agent)
+                if column is None:
+                    column = agents[agent] = np.full(n, np.nan)
+                column[i] = score_data["raw_score"]
+        
+        self._columns = {"labels": labels, "overall": overall, "agents": agents}
+        self._columns_source = data
+        return self._columns
     
     def record_score(
         self,
@@ -111,13 +223,8 @@ class ScoringEngine:
             "reviews": raw_review.get("reviews", [])
         }
         
-        # Persist
-        data = self._load_scores()
-        data["runs"].append(record)
-        
-        # Keep last 500 records to avoid unbounded growth
-        data["runs"] = data["runs"][-500:]
-        self._save_scores(data)
+        # Persist (only the last MAX_RUNS records are kept)
+        self._append_run(record)
         
         print(f"📊 [ScoringEngine] Recorded {benchmark_id}: raw={raw_avg:.1f}, weighted={weighted_avg:.1f}")
         
@@ -158,35 +265,18 @@ class ScoringEngine:
                 "overall": [scores]
             }
         """
-        data = self._load_scores()
-        runs = data.get("runs", [])
+        columns = self._load_columns()
         
-        if not runs:
+        if not columns["labels"]:
             return {"labels": [], "datasets": {}, "overall": []}
         
-        labels = []
-        overall_scores = []
-        agent_datasets: Dict[str, List] = {}
-        
-        for run in runs:
-            labels.append(run["timestamp"])
-            overall_scores.append(run["overall_raw_score"])
-            
-            for agent, score_data in run.get("agent_scores", {}).items():
-                if agent not in agent_datasets:
-                    # Backfill with None for previous entries
-                    agent_datasets[agent] = [None] * (len(labels) - 1)
-                agent_datasets[agent].append(score_data["raw_score"])
-            
-            # Fill None for agents not in this run
-            for agent in agent_datasets:
-                if len(agent_datasets[agent]) < len(labels):
-                    agent_datasets[agent].append(None)
-        
         return {
-            "labels": labels,
-            "datasets": agent_datasets,
-            "overall": overall_scores
+            "labels": list(columns["labels"]),
+            "datasets": {
+                agent: [None if np.isnan(score) else score for score in column.tolist()]
+                for agent, column in columns["agents"].items()
+            },
+            "overall": columns["overall"].tolist()
         }
     
     def get_trend(self, agent_name: Optional[str] = None, last_n: int = 10) -> Dict[str, Any]:
@@ -203,28 +293,31 @@ class ScoringEngine:
                 "max_score": float
             }
         """
-        data = self._load_scores()
-        runs = data.get("runs", [])[-last_n:]
+        columns = self._load_columns()
+        overall = columns["overall"][-last_n:]
         
-        if len(runs) < 2:
+        if len(overall) < 2:
+            first = float(overall[0]) if len(overall) else 0
             return {
                 "direction": "insufficient_data",
                 "slope": 0,
                 "delta": 0,
-                "avg_score": runs[0]["overall_raw_score"] if runs else 0,
-                "min_score": runs[0]["overall_raw_score"] if runs else 0,
-                "max_score": runs[0]["overall_raw_score"] if runs else 0
+                "avg_score": first,
+                "min_score": first,
+                "max_score": first
             }
         
         if agent_name:
-            scores = []
-            for r in runs:
-                agent_data = r.get("agent_scores", {}).get(agent_name)
-                if agent_data:
-                    scores.append(agent_data["raw_score"])
+            column = columns["agents"].get(agent_name, np.empty(0))[-last_n:]
+            scores = column[~np.isnan(column)].tolist()
         else:
-            scores = [r["overall_raw_score"] for r in runs]
+            scores = overall.tolist()
         
+        return self._trend_from_scores(scores)
+    
+    @staticmethod
+    def _trend_from_scores(scores: List[float]) -> Dict[str, Any]:
+        """Slope, delta and range stats for an ordered list of scores"""
         if len(scores) < 2:
             return {
                 "direction": "insufficient_data",
@@ -235,15 +328,9 @@ class ScoringEngine:
                 "max_score": scores[0] if scores else 0
             }
         
-        # Simple linear regression slope
-        n = len(scores)
-        x_mean = (n - 1) / 2
-        y_mean = sum(scores) / n
-        
-        numerator = sum((i - x_mean) * (s - y_mean) for i, s in enumerate(scores))
-        denominator = sum((i - x_mean) ** 2 for i in range(n))
-        
-        slope = numerator / denominator if denominator != 0 else 0
+        # Simple linear regression slope (least-squares fit over run index)
+        y = np.asarray(scores, dtype=np.float64)
+        slope, _, mean, _, lo, hi = slope_and_stats(np.arange(len(y), dtype=np.float64), y)
         delta = scores[-1] - scores[0]
         
         # Classify trend
@@ -256,11 +343,11 @@ class ScoringEngine:
         
         return {
             "direction": direction,
-            "slope": round(slope, 3),
+            "slope": round(float(slope), 3),
             "delta": round(delta, 2),
-            "avg_score": round(statistics.mean(scores), 2),
-            "min_score": round(min(scores), 2),
-            "max_score": round(max(scores), 2)
+            "avg_score": round(float(mean), 2),
+            "min_score": round(float(lo), 2),
+            "max_score": round(float(hi), 2)
         }
     
     def compare_runs(self, run_id_a: str, run_id_b: str) -> Dict[str, Any]:
@@ -348,31 +435,32 @@ class ScoringEngine:
                 ...
             }
         """
-        data = self._load_scores()
-        runs = data.get("runs", [])
+        columns = self._load_columns()
+        run_count = len(columns["labels"])
         
-        agent_runs: Dict[str, List[float]] = {}
-        
-        for run in runs:
-            for agent, score_data in run.get("agent_scores", {}).items():
-                if agent not in agent_runs:
-                    agent_runs[agent] = []
-                agent_runs[agent].append(score_data["raw_score"])
+        # Same window get_trend() uses by default
+        trend_window = 10
         
         summary = {}
         # Filter out system components and non-worker agents
         system_keywords = ["system", "orchestrator", "supervisor", "user"]
         
-        for agent, scores in agent_runs.items():
+        for agent, column in columns["agents"].items():
             agent_lower = agent.lower()
             # aggressive filtering: if name contains any system keyword, skip it
             # ensuring we don't accidentally skip valid agents (e.g. Unit Tester has 'test', but not system words)
             if any(keyword in agent_lower for keyword in system_keywords):
                 continue
-                
-            trend_data = self.get_trend(agent_name=agent)
+            
+            present = ~np.isnan(column)
+            scores = column[present].tolist()
+            if run_count < 2:
+                trend_data = self._trend_from_scores([])
+            else:
+                recent = column[-trend_window:]
+                trend_data = self._trend_from_scores(recent[~np.isnan(recent)].tolist())
             summary[agent] = {
-                "avg_score": round(statistics.mean(scores), 2) if scores else 0,
+                "avg_score": round(statistics.fmean(scores), 2) if scores else 0,
                 "trend": trend_data["direction"],
                 "slope": trend_data["slope"],
                 "run_count": len(scores),
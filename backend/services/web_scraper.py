@@ -3,14 +3,114 @@ import sys
 import asyncio
 
 # AT THE ABSOLUTE TOP - BEFORE ANYTHING ELSE
+# Prefer the libuv-based loops when available; Windows still needs Proactor semantics
+# (subprocess support for Playwright) when winloop is not installed.
 if sys.platform == 'win32':
-    asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    _WINDOWS_SUBPROCESS_POLICIES = (asyncio.WindowsProactorEventLoopPolicy,)
+    try:
+        import winloop
+        _WINDOWS_SUBPROCESS_POLICIES += (winloop.EventLoopPolicy,)
+        asyncio.set_event_loop_policy(winloop.EventLoopPolicy())
+    except ImportError:
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+else:
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
 
-from typing import List, Optional, Dict
-from urllib.parse import quote_plus
+import atexit
+import hashlib
+import importlib.util
+import logging
+import queue
+import re
+from logging.handlers import QueueHandler, QueueListener
+from collections import deque
+from typing import Deque, List, Optional, Dict, Tuple
+from urllib.parse import quote_plus, urlsplit
 
 import httpx
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
+
+
+# --- Logging ---
+# Records are handed to a queue and written by a listener thread, so concurrent
+# fetches never block on stdout. Set SCRAPER_LOG_LEVEL=WARNING to silence diagnostics.
+logger = logging.getLogger("scraper")
+_log_level = os.getenv("SCRAPER_LOG_LEVEL", "INFO").upper()
+_log_level_known = isinstance(logging.getLevelName(_log_level), int)
+logger.setLevel(_log_level if _log_level_known else logging.INFO)
+logger.propagate = False
+
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = QueueListener(_log_queue, _log_handler)
+logger.addHandler(QueueHandler(_log_queue))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+if not _log_level_known:
+    logger.warning("⚠️ [SCRAPER] Unknown SCRAPER_LOG_LEVEL %r, using INFO", _log_level)
+
+
+# --- HTTP client capabilities ---
+# HTTP/2 needs the optional `h2` package and brotli decoding needs `brotli`
+# (both pulled in by httpx[http2] and brotli in requirements.txt).
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_ACCEPT_ENCODING = "br, gzip, deflate" if importlib.util.find_spec("brotli") else "gzip, deflate"
+
+
+# --- DuckDuckGo result parsing ---
+# Compiled once; each result row is resolved with three relative XPath lookups.
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+_XP_DDG_RESULTS = etree.XPath(f"//*[{_has_class('result__body')}]")
+_XP_DDG_TITLE = etree.XPath(f".//*[{_has_class('result__title')}]")
+_XP_DDG_SNIPPET = etree.XPath(f".//*[{_has_class('result__snippet')}]")
+_XP_DDG_URL = etree.XPath(f".//*[{_has_class('result__url')}]")
+
+
+def _first(elements: list):
+    return elements[0] if elements else None
+
+
+def _joined_text(element) -> str:
+    """Equivalent of BeautifulSoup's get_text(separator=' ', strip=True)"""
+    return " ".join(chunk.strip() for chunk in element.itertext() if chunk.strip())
+
+
+# --- Page text cleanup ---
+_MAX_PAGE_CHARS = 15000
+_MAX_RAW_CHARS = 20000  # Headroom for the blank-line collapse below
+_BLANK_LINES_RE = re.compile(r'(?:[ \t]*\n){3,}')
+
+
+def _content_digest(text: str) -> bytes:
+    """Cheap 64-bit fingerprint used to drop pages whose extracted text is identical"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest()
+
+
+def _extract_main_text(html: str) -> Optional[str]:
+    """Strip page chrome and return the main readable text (blocking, run in a worker thread)"""
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    # Remove unwanted elements
+    for tag in soup(['script', 'style', 'nav', 'footer', 'header', 'aside', 'iframe', 'noscript', 'svg']):
+        tag.decompose()
+    
+    # Find main content
+    main = soup.find('main') or soup.find('article') or soup.find(id='content') or soup.find(class_='content') or soup.find('body')
+    if not main:
+        return None
+    
+    # Truncate before cleanup so the regex never walks text that is about to be discarded
+    text = main.get_text(separator='\n', strip=True)[:_MAX_RAW_CHARS]
+    return _BLANK_LINES_RE.sub('\n\n', text)[:_MAX_PAGE_CHARS]
 
 
 class WebScraper:
@@ -29,37 +129,87 @@ class WebScraper:
         "pytorch.org",
         "tensorflow.org"
     ]
+    STATIC_HOSTS = frozenset(ALLOWED_DOMAINS)
+    
+    # Per-host "needs JS" learning: once httpx succeeded this many times in the
+    # last HOST_HISTORY_SIZE fetches, a short page no longer triggers Playwright
+    HOST_HISTORY_SIZE = 5
+    HOST_STATIC_THRESHOLD = 3
     
     def __init__(self):
         self.enabled = os.getenv("ENABLE_BROWSER_AGENT", "true").lower() == "true"
         self.timeout = 20.0
         self.browser_path = os.getenv("BROWSER_EXECUTABLE_PATH")
         self.user_data_dir = os.getenv("BROWSER_USER_DATA_DIR")
+        self._client: Optional[httpx.AsyncClient] = None
+        self._logged_http_version = False
+        self._httpx_outcomes: Dict[str, Deque[bool]] = {}
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Shared pooled client - HTTP/2 lets fetches to the same host multiplex one connection"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=15.0,
+                follow_redirects=True,
+                http2=_HTTP2_AVAILABLE,
+                headers={"Accept-Encoding": _ACCEPT_ENCODING}
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     async def fetch_page(self, url: str) -> Optional[str]:
-        """Fetch a web page - tries Playwright first, falls back to httpx"""
-        print(f"\n{'─'*50}")
-        print(f"🌐 [SCRAPER] fetch_page called for: {url}")
-        print(f"{'─'*50}")
+        """Fetch a web page - tries httpx first, falls back to Playwright for JS-heavy hosts"""
+        logger.debug("🌐 [SCRAPER] fetch_page called for: %s", url)
         
         # Validate URL
         if not url or not url.startswith("http"):
-            print(f"⚠️ [SCRAPER] Invalid URL: {url}")
+            logger.warning("⚠️ [SCRAPER] Invalid URL: %s", url)
             return None
         
-        # Try httpx first (more reliable on Windows with uvicorn)
-        content = await self._fetch_with_httpx(url)
-        if content:
-            return content
+        host = (urlsplit(url).hostname or "").lower()
+        
+        # Known static-HTML hosts: a short httpx page is the real page, Playwright won't do better
+        if self._is_static_host(host):
+            content, got_page = await self._fetch_with_httpx(url, allow_short=True)
+            if content or got_page:
+                return content
+        else:
+            # Try httpx first (more reliable on Windows with uvicorn)
+            content, got_page = await self._fetch_with_httpx(url)
+            outcomes = self._httpx_outcomes.setdefault(host, deque(maxlen=self.HOST_HISTORY_SIZE))
+            outcomes.append(bool(content))
+            if content:
+                return content
+            
+            if got_page and sum(outcomes) >= self.HOST_STATIC_THRESHOLD:
+                logger.info("⏭️ [SCRAPER] httpx usually works for %s, skipping Playwright", host)
+                return None
         
-        # Fallback to Playwright for JS-heavy sites
-        print(f"🔄 [SCRAPER] httpx failed, trying Playwright...")
+        # Fallback to Playwright for JS-heavy sites, error statuses (403/429 to bots) and network failures
+        logger.info("🔄 [SCRAPER] httpx failed, trying Playwright...")
         return await self._fetch_with_playwright(url)
     
-    async def _fetch_with_httpx(self, url: str) -> Optional[str]:
-        """Simple HTTP fetch with httpx - doesn't execute JavaScript"""
+    def _is_static_host(self, host: str) -> bool:
+        """True for ALLOWED_DOMAINS hosts (and their subdomains), which serve plain HTML"""
+        if host in self.STATIC_HOSTS:
+            return True
+        # Subdomains: look up each parent domain instead of scanning the whole set
+        parts = host.split(".")
+        return any(".".join(parts[i:]) in self.STATIC_HOSTS for i in range(1, len(parts)))
+    
+    async def _fetch_with_httpx(self, url: str, allow_short: bool = False) -> Tuple[Optional[str], bool]:
+        """
+        Simple HTTP fetch with httpx - doesn't execute JavaScript.
+        Returns (text, got_page); got_page is True when the server answered 200,
+        so a None text means the page was short rather than blocked or unreachable.
+        """
         try:
-            print(f"📡 [SCRAPER] Trying httpx for: {url}")
+            logger.debug("📡 [SCRAPER] Trying httpx for: %s", url)
             
             headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -67,69 +217,63 @@ class WebScraper:
                 "Accept-Language": "en-US,en;q=0.5",
             }
             
-            async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-                response = await client.get(url, headers=headers)
-                
-                if response.status_code != 200:
-                    print(f"⚠️ [SCRAPER] httpx got status {response.status_code}")
-                    return None
-                
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Remove unwanted elements
-                for tag in soup(['script', 'style', 'nav', 'footer', 'header', 'aside', 'iframe', 'noscript', 'svg']):
-                    tag.decompose()
-                
-                # Find main content
-                main = soup.find('main') or soup.find('article') or soup.find(id='content') or soup.find(class_='content') or soup.find('body')
-                
-                if main:
-                    import re
-                    text = main.get_text(separator='\n', strip=True)
-                    text = re.sub(r'\n{3,}', '\n\n', text)
-                    final_text = text[:15000]
-                    
-                    if len(final_text) > 500:  # Only return if we got meaningful content
-                        print(f"✅ [SCRAPER/httpx] Extracted {len(final_text)} chars from {url}")
-                        print(f"📝 [PREVIEW]: {final_text[:200]}...")
-                        return final_text
-                    else:
-                        print(f"⚠️ [SCRAPER/httpx] Content too short ({len(final_text)} chars), might need JS")
-                        return None
-                
-                print(f"⚠️ [SCRAPER/httpx] No main content element found")
-                return None
-                
+            client = self._get_client()
+            response = await client.get(url, headers=headers)
+            
+            if not self._logged_http_version:
+                logger.debug("🔌 [SCRAPER] Negotiated %s with %s", response.http_version, response.url.host)
+                self._logged_http_version = True
+            
+            if response.status_code != 200:
+                logger.info("⚠️ [SCRAPER] httpx got status %s", response.status_code)
+                return None, False
+            
+            # Parse off the event loop so other fetches keep making progress.
+            # Pass text, not bytes, so the Content-Type charset httpx decoded with is respected.
+            final_text = await asyncio.to_thread(_extract_main_text, response.text)
+            
+            if final_text is None:
+                logger.info("⚠️ [SCRAPER/httpx] No main content element found")
+                return None, True
+            
+            if len(final_text) > 500 or (allow_short and final_text):  # Only return if we got meaningful content
+                logger.info("✅ [SCRAPER/httpx] Extracted %d chars from %s", len(final_text), url)
+                logger.debug("📝 [PREVIEW]: %s...", final_text[:200])
+                return final_text, True
+            
+            logger.info("⚠️ [SCRAPER/httpx] Content too short (%d chars), might need JS", len(final_text))
+            return None, True
+            
         except Exception as e:
-            print(f"⚠️ [SCRAPER/httpx] Failed: {type(e).__name__}: {e}")
-            return None
+            logger.warning("⚠️ [SCRAPER/httpx] Failed: %s: %s", type(e).__name__, e)
+            return None, False
 
     async def _fetch_with_playwright(self, url: str) -> Optional[str]:
         """Fetch using Playwright - handles JavaScript-heavy sites"""
         # Circuit breaker for Playwright
         if getattr(self, "playwright_disabled", False):
-            print(f"⚠️ [SCRAPER] Playwright disabled due to previous error. Skipping.")
+            logger.info("⚠️ [SCRAPER] Playwright disabled due to previous error. Skipping.")
             return None
 
         import sys
         import asyncio
         
-        # On Windows, we need ProactorEventLoop for subprocesses
+        # On Windows, we need ProactorEventLoop (or winloop) for subprocesses
         if sys.platform == 'win32':
             try:
                 policy = asyncio.get_event_loop_policy()
-                if not isinstance(policy, asyncio.WindowsProactorEventLoopPolicy):
-                    print(f"🔧 [SCRAPER] Setting WindowsProactorEventLoopPolicy...")
+                if not isinstance(policy, _WINDOWS_SUBPROCESS_POLICIES):
+                    logger.debug("🔧 [SCRAPER] Setting WindowsProactorEventLoopPolicy...")
                     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
             except Exception as e:
-                print(f"⚠️ [SCRAPER] Could not set event loop policy: {e}")
+                logger.warning("⚠️ [SCRAPER] Could not set event loop policy: %s", e)
                 self.playwright_disabled = True
                 return None
 
         try:
             from playwright.async_api import async_playwright
         except ImportError:
-            print(f"⚠️ [SCRAPER] Playwright not installed")
+            logger.warning("⚠️ [SCRAPER] Playwright not installed")
             return None
         
         import tempfile
@@ -138,29 +282,29 @@ class WebScraper:
         user_dir = self.user_data_dir or tempfile.mkdtemp(prefix="ai_scraper_")
         
         try:
-            print(f"🚀 [SCRAPER] Starting Playwright...")
+            logger.debug("🚀 [SCRAPER] Starting Playwright...")
             async with async_playwright() as p:
                 launch_kwargs = {
                     "headless": True,
                     "args": ["--disable-dev-shm-usage", "--no-sandbox"]
                 }
                 if self.browser_path:
-                    print(f"🔧 [SCRAPER] Using custom browser: {self.browser_path}")
+                    logger.debug("🔧 [SCRAPER] Using custom browser: %s", self.browser_path)
                     launch_kwargs["executable_path"] = self.browser_path
                 else:
-                    print(f"🔧 [SCRAPER] Using bundled Chromium")
+                    logger.debug("🔧 [SCRAPER] Using bundled Chromium")
 
                 browser_context = None
                 for attempt in range(3):
                     try:
-                        print(f"🎯 [SCRAPER] Launch attempt {attempt + 1}/3...")
+                        logger.debug("🎯 [SCRAPER] Launch attempt %d/3...", attempt + 1)
                         browser_context = await p.chromium.launch_persistent_context(
                             user_dir,
                             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
                             viewport={'width': 1280, 'height': 800},
                             **launch_kwargs
                         )
-                        print(f"✅ [SCRAPER] Browser launched successfully!")
+                        logger.debug("✅ [SCRAPER] Browser launched successfully!")
                         break
                     except Exception as e:
                         if "is already in use" in str(e) or "lock" in str(e).lower():
@@ -173,7 +317,7 @@ class WebScraper:
 
                 page = await browser_context.new_page()
                 
-                print(f"🌐 [BROWSER] Navigating to: {url}")
+                logger.debug("🌐 [BROWSER] Navigating to: %s", url)
                 await page.goto(url, wait_until="domcontentloaded", timeout=25000)
                 await asyncio.sleep(1.5) 
                 
@@ -183,34 +327,22 @@ class WebScraper:
                 if not self.user_data_dir:
                     shutil.rmtree(user_dir, ignore_errors=True)
                 
-                soup = BeautifulSoup(content, 'html.parser')
+                final_text = await asyncio.to_thread(_extract_main_text, content)
                 
-                for tag in soup(['script', 'style', 'nav', 'footer', 'header', 'aside', 'iframe', 'noscript', 'svg']):
-                    tag.decompose()
-                
-                main = soup.find('main') or soup.find('article') or soup.find(id='content') or soup.find(class_='content') or soup.find('body')
-                
-                if main:
-                    import re
-                    text = main.get_text(separator='\n', strip=True)
-                    text = re.sub(r'\n{3,}', '\n\n', text)
-                    final_text = text[:15000]
-                    
-                    print(f"✅ [SCRAPER/Playwright] Extracted {len(final_text)} chars from {url}")
-                    print(f"📝 [PREVIEW]: {final_text[:200]}...")
+                if final_text is not None:
+                    logger.info("✅ [SCRAPER/Playwright] Extracted %d chars from %s", len(final_text), url)
+                    logger.debug("📝 [PREVIEW]: %s...", final_text[:200])
                     return final_text
                 
-                print(f"❌ [SCRAPER/Playwright] No main content found for {url}")
+                logger.warning("❌ [SCRAPER/Playwright] No main content found for %s", url)
                 return None
         except NotImplementedError:
-            print(f"❌ [SCRAPER/Playwright] NotImplementedError - uvicorn event loop conflict on Windows")
-            print(f"   This is a known issue. Disabling Playwright for this session.")
+            logger.warning("❌ [SCRAPER/Playwright] NotImplementedError - uvicorn event loop conflict on Windows. "
+                           "Disabling Playwright for this session.")
             self.playwright_disabled = True
             return None
         except Exception as e:
-            print(f"💥 [SCRAPER/Playwright] Exception: {type(e).__name__}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("💥 [SCRAPER/Playwright] Exception: %s: %s", type(e).__name__, e)
             return None
     
     async def search_web(self, query: str, max_results: int = 5) -> List[Dict]:
@@ -223,55 +355,54 @@ class WebScraper:
         if serper_key:
             return await self._search_serper(query, max_results, serper_key)
         else:
-            print("⚠️ [SEARCH] No SERPER_API_KEY found, falling back to DuckDuckGo scraping")
+            logger.warning("⚠️ [SEARCH] No SERPER_API_KEY found, falling back to DuckDuckGo scraping")
             return await self._search_duckduckgo_fallback(query, max_results)
     
     async def _search_serper(self, query: str, max_results: int, api_key: str) -> List[Dict]:
         """Search using Serper.dev API"""
-        print(f"🔍 [SERPER] Searching for: {query}")
+        logger.info("🔍 [SERPER] Searching for: %s", query)
         
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.post(
-                    "https://google.serper.dev/search",
-                    headers={
-                        "X-API-KEY": api_key,
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "q": query,
-                        "num": max_results
-                    }
-                )
-                
-                if response.status_code != 200:
-                    print(f"❌ [SERPER] API error: {response.status_code}")
-                    print(f"   Response: {response.text[:500]}")
-                    return [{"title": "Search Error", "snippet": f"Serper API returned {response.status_code}", "url": ""}]
-                
-                data = response.json()
-                results = []
-                
-                # Parse organic results
-                organic = data.get("organic", [])
-                print(f"✅ [SERPER] Got {len(organic)} results")
-                
-                for item in organic[:max_results]:
-                    result = {
-                        "title": item.get("title", "No title"),
-                        "snippet": item.get("snippet", ""),
-                        "url": item.get("link", "")
-                    }
-                    results.append(result)
-                    print(f"   📄 {result['title'][:50]} - {result['url'][:60]}")
-                
-                if not results:
-                    return [{"title": "No results", "snippet": f"No results found for '{query}'", "url": ""}]
-                
-                return results
-                
+            client = self._get_client()
+            response = await client.post(
+                "https://google.serper.dev/search",
+                headers={
+                    "X-API-KEY": api_key,
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "q": query,
+                    "num": max_results
+                }
+            )
+            
+            if response.status_code != 200:
+                logger.error("❌ [SERPER] API error: %s\n   Response: %s", response.status_code, response.text[:500])
+                return [{"title": "Search Error", "snippet": f"Serper API returned {response.status_code}", "url": ""}]
+            
+            data = response.json()
+            results = []
+            
+            # Parse organic results
+            organic = data.get("organic", [])
+            logger.info("✅ [SERPER] Got %d results", len(organic))
+            
+            for item in organic[:max_results]:
+                result = {
+                    "title": item.get("title", "No title"),
+                    "snippet": item.get("snippet", ""),
+                    "url": item.get("link", "")
+                }
+                results.append(result)
+                logger.debug("   📄 %s - %s", result['title'][:50], result['url'][:60])
+            
+            if not results:
+                return [{"title": "No results", "snippet": f"No results found for '{query}'", "url": ""}]
+            
+            return results
+            
         except Exception as e:
-            print(f"💥 [SERPER] Exception: {type(e).__name__}: {e}")
+            logger.error("💥 [SERPER] Exception: %s: %s", type(e).__name__, e)
             return [{"title": "Search Error", "snippet": str(e), "url": ""}]
     
     async def _search_duckduckgo_fallback(self, query: str, max_results: int) -> List[Dict]:
@@ -287,42 +418,41 @@ class WebScraper:
                 "Accept-Language": "en-US,en;q=0.5",
                 "Referer": "https://duckduckgo.com/",
                 "DNT": "1",
-                "Connection": "keep-alive",
                 "Upgrade-Insecure-Requests": "1"
             }
             
-            async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-                response = await client.get(search_url, headers=headers)
-                
-                if response.status_code != 200:
-                    print(f"Search failed: Status {response.status_code}")
-                    return [{"title": f"Search Error: Code {response.status_code}", "snippet": "Could not access search engine.", "url": ""}]
+            client = self._get_client()
+            response = await client.get(search_url, headers=headers)
+            
+            if response.status_code != 200:
+                logger.warning("Search failed: Status %s", response.status_code)
+                return [{"title": f"Search Error: Code {response.status_code}", "snippet": "Could not access search engine.", "url": ""}]
+
+            doc = lxml_html.fromstring(response.content)
+            
+            found_items = _XP_DDG_RESULTS(doc)
+            if not found_items:
+                if "If this error persists" in response.text:
+                    return [{"title": "Search Blocked", "snippet": "DuckDuckGo is blocking requests. Add SERPER_API_KEY to .env for reliable search.", "url": ""}]
+                return [{"title": "No results found", "snippet": f"No results for '{query}'", "url": ""}]
 
-                soup = BeautifulSoup(response.text, 'html.parser')
+            for result in found_items[:max_results]:
+                title_elem = _first(_XP_DDG_TITLE(result))
+                snippet_elem = _first(_XP_DDG_SNIPPET(result))
+                link_elem = _first(_XP_DDG_URL(result))
                 
-                found_items = soup.select('.result__body')
-                if not found_items:
-                    if "If this error persists" in response.text:
-                        return [{"title": "Search Blocked", "snippet": "DuckDuckGo is blocking requests. Add SERPER_API_KEY to .env for reliable search.", "url": ""}]
-                    return [{"title": "No results found", "snippet": f"No results for '{query}'", "url": ""}]
-
-                for i, result in enumerate(found_items[:max_results]):
-                    title_elem = result.select_one('.result__title')
-                    snippet_elem = result.select_one('.result__snippet')
-                    link_elem = result.select_one('.result__url')
-                    
-                    if title_elem:
-                        raw_url = link_elem.get_text(strip=True) if link_elem else ""
-                        if not raw_url.startswith("http"):
-                            raw_url = f"https://{raw_url}"
-                             
-                        results.append({
-                            "title": title_elem.get_text(separator=' ', strip=True),
-                            "snippet": snippet_elem.get_text(separator=' ', strip=True) if snippet_elem else "",
-                            "url": raw_url
-                        })
+                if title_elem is not None:
+                    raw_url = "".join(t.strip() for t in link_elem.itertext()) if link_elem is not None else ""
+                    if not raw_url.startswith("http"):
+                        raw_url = f"https://{raw_url}"
+                         
+                    results.append({
+                        "title": _joined_text(title_elem),
+                        "snippet": _joined_text(snippet_elem) if snippet_elem is not None else "",
+                        "url": raw_url
+                    })
         except Exception as e:
-            print(f"Search error: {e}")
+            logger.error("Search error: %s", e)
             return [{"title": "Search System Error", "snippet": str(e), "url": ""}]
         
         return results
@@ -371,9 +501,16 @@ class WebScraper:
         content_map = {c["url"]: c["content"] for c in detailed_contents}
         
         content_results = []
+        seen_digests = set()
         for result in valid_search_results[:limit]:
             url = result["url"]
             if url in content_map:
+                # Mirrors/AMP/mobile variants often extract to identical text; send it downstream once
+                digest = _content_digest(content_map[url])
+                if digest in seen_digests:
+                    logger.debug("♻️ [SCRAPER] Skipping duplicate content from %s", url)
+                    continue
+                seen_digests.add(digest)
                 content_results.append({
                     "title": result["title"],
                     "url": url,
@@ -0,0 +1,19 @@
+import os
+
+
+def fast_rmtree(root):
+    """Remove a directory tree in a single scandir pass (test fixture helper)"""
+    stack = [os.fspath(root)]
+    files = []
+    dirs = []
+    while stack:
+        d = stack.pop()
+        dirs.append(d)
+        with os.scandir(d) as it:
+            for e in it:
+                (stack if e.is_dir(follow_symlinks=False) else files).append(e.path)
+    for f in files:
+        os.unlink(f)
+    # Children were discovered after their parents, so remove in reverse
+    for d in reversed(dirs):
+        os.rmdir(d)
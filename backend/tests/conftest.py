@@ -0,0 +1,37 @@
+import sys
+import pytest
+from pathlib import Path
+
+# Add backend directory to sys.path
+backend_dir = Path(__file__).resolve().parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--integration", action="store_true", default=False,
+        help="run tests marked 'integration' (live network / browser)"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "integration: needs live network access; skipped unless --integration is given")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--integration"):
+        return
+    skip = pytest.mark.skip(reason="needs --integration")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Shared API test client; app startup/shutdown runs once for the whole session"""
+    from main import app
+    from fastapi.testclient import TestClient
+    with TestClient(app) as c:
+        yield c
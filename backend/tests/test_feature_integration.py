@@ -1,18 +1,15 @@
 import sys
 import os
-import shutil
 import pytest
 from pathlib import Path
-from fastapi.testclient import TestClient
 
 # Add backend directory to sys.path
 backend_dir = Path(__file__).resolve().parent.parent
 if str(backend_dir) not in sys.path:
     sys.path.insert(0, str(backend_dir))
 
-from main import app, file_manager
-
-client = TestClient(app)
+from main import file_manager
+from _fastrmtree import fast_rmtree
 
 # Setup temporary test workspaces
 TEST_ROOT = Path("test_environments").resolve()
@@ -23,7 +20,7 @@ PROJECT_B = TEST_ROOT / "project_b"
 def setup_teardown():
     # Cleanup any old test artifacts
     if TEST_ROOT.exists():
-        shutil.rmtree(TEST_ROOT)
+        fast_rmtree(TEST_ROOT)
     
     # Create test projects
     PROJECT_A.mkdir(parents=True)
@@ -43,10 +40,10 @@ def setup_teardown():
     
     # Teardown
     if TEST_ROOT.exists():
-        shutil.rmtree(TEST_ROOT)
+        fast_rmtree(TEST_ROOT)
     file_manager.workspace_path = original_workspace
 
-def test_status_no_workspace():
+def test_status_no_workspace(client):
     """Verify system state when no workspace is active"""
     file_manager.workspace_path = None
     response = client.get("/files")
@@ -54,7 +51,7 @@ def test_status_no_workspace():
     assert response.json()["files"] == []
     assert response.json()["workspace"] is None
 
-def test_set_workspace_and_switch():
+def test_set_workspace_and_switch(client):
     """Test the 'Safe Switch' project switching functionality"""
     # Switch to Project A
     response = client.post("/set-workspace", json={"path": str(PROJECT_A)})
@@ -75,7 +72,7 @@ def test_set_workspace_and_switch():
     assert "readme.md" in file_paths
     assert "index.html" not in file_paths # Safe switch check
 
-def test_rename_file_and_folder():
+def test_rename_file_and_folder(client):
     """Test inline renaming for both files and folders"""
     client.post("/set-workspace", json={"path": str(PROJECT_A)})
     
@@ -98,7 +95,7 @@ def test_rename_file_and_folder():
     assert (PROJECT_A / "css" / "main.css").exists()
     assert not (PROJECT_A / "styles").exists()
 
-def test_move_file_and_folder_to_root():
+def test_move_file_and_folder_to_root(client):
     """Test drag and drop movement to root and nested folders"""
     client.post("/set-workspace", json={"path": str(PROJECT_A)})
     
@@ -123,7 +120,7 @@ def test_move_file_and_folder_to_root():
     assert response.status_code == 200
     assert (PROJECT_A / "css" / "temp").is_dir()
 
-def test_create_folder_duplicate_handling():
+def test_create_folder_duplicate_handling(client):
     """Test folder creation with existing paths"""
     client.post("/set-workspace", json={"path": str(PROJECT_A)})
     
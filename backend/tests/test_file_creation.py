@@ -1,9 +1,9 @@
 import pytest
 import os
-import shutil
 from pathlib import Path
 import asyncio
 from services.file_manager import FileManager
+from _fastrmtree import fast_rmtree
 
 # Mock environment variable for max file size
 os.environ["MAX_FILE_SIZE_MB"] = "10"
@@ -15,12 +15,12 @@ def file_manager():
     # For integration testing, let's use a subdirectory 'test_env'
     fm.workspace_path = Path("./projects/test_env").resolve()
     if fm.workspace_path.exists():
-        shutil.rmtree(fm.workspace_path)
+        fast_rmtree(fm.workspace_path)
     fm.workspace_path.mkdir(parents=True, exist_ok=True)
     yield fm
     # Cleanup
     if fm.workspace_path.exists():
-        shutil.rmtree(fm.workspace_path)
+        fast_rmtree(fm.workspace_path)
 
 @pytest.mark.asyncio
 async def test_create_file_in_folder_success(file_manager):
@@ -67,3 +67,11 @@ async def test_error_creating_file_on_existing_folder(file_manager):
         await file_manager.save_file_from_content("my_folder", "content")
         
     assert "A folder with this name already exists" in str(excinfo.value)
+
+def test_reopening_workspace_clears_pending_changes(file_manager):
+    file_manager.set_workspace(file_manager.workspace_path)
+    file_manager.pending_changes["stale"] = object()
+    
+    # Re-opening the same folder takes the fast path but must not keep stale edits
+    file_manager.set_workspace(file_manager.workspace_path)
+    assert file_manager.pending_changes == {}
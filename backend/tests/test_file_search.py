@@ -1,4 +1,5 @@
 import pytest
+import os
 from pathlib import Path
 from services.file_manager import FileManager
 
@@ -17,3 +18,19 @@ async def test_search():
     print(f"Search results for 'agents': {len(search_results)}")
     for f in search_results:
         print(f" - {f['path']}")
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not hasattr(os, "geteuid") or os.geteuid() == 0, reason="needs POSIX permissions as non-root")
+async def test_unreadable_folder_is_skipped(tmp_path):
+    (tmp_path / "ok").mkdir()
+    (tmp_path / "ok" / "a.py").write_text("x = 1")
+    locked = tmp_path / "locked"
+    locked.mkdir()
+    locked.chmod(0)
+    try:
+        fm = FileManager()
+        fm.workspace_path = tmp_path
+        paths = [f["path"] for f in await fm.get_directory()]
+        assert paths == ["locked", "ok", "ok/a.py"]
+    finally:
+        locked.chmod(0o755)
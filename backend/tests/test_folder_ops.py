@@ -1,17 +1,14 @@
 
 import pytest
-from fastapi.testclient import TestClient
 import os
-import shutil
 import sys
 from pathlib import Path
 
 # Add parent directory to path to allow importing main
 sys.path.append(str(Path(__file__).parent.parent))
 
-from main import app, file_manager
-
-client = TestClient(app)
+from main import file_manager
+from _fastrmtree import fast_rmtree
 
 # Setup a temporary test workspace
 TEST_WORKSPACE = "test_workspace_folder_ops"
@@ -27,22 +24,22 @@ def setup_teardown():
     
     # Teardown
     if os.path.exists(TEST_WORKSPACE):
-        shutil.rmtree(TEST_WORKSPACE)
+        fast_rmtree(TEST_WORKSPACE)
     file_manager.workspace_path = original_workspace
 
-def test_create_folder():
+def test_create_folder(client):
     """Test creating a new folder via API"""
     response = client.post("/create-folder", data={"path": "new_folder"})
     assert response.status_code == 200
     assert os.path.isdir(os.path.join(TEST_WORKSPACE, "new_folder"))
 
-def test_create_nested_folder():
+def test_create_nested_folder(client):
     """Test creating a nested folder via API"""
     response = client.post("/create-folder", data={"path": "parent/child"})
     assert response.status_code == 200
     assert os.path.isdir(os.path.join(TEST_WORKSPACE, "parent", "child"))
 
-def test_move_folder():
+def test_move_folder(client):
     """Test moving a folder via API"""
     # Create source folder
     source = os.path.join(TEST_WORKSPACE, "source_folder")
@@ -60,7 +57,7 @@ def test_move_folder():
     assert not os.path.exists(source)
     assert os.path.exists(os.path.join(dest_dir, "source_folder"))
 
-def test_move_file():
+def test_move_file(client):
     """Test moving a file via API"""
     # Create source file and target folder
     source_file = os.path.join(TEST_WORKSPACE, "test_file.txt")
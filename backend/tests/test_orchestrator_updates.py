@@ -33,3 +33,24 @@ async def test_file_change_concise():
     assert "[EDIT_FILE:" not in clean_message
     assert "print('new code')" in clean_message
     print("✅ Concise message logic successful")
+
+def test_apply_replacements_skips_nested_ranges():
+    first = "```python\nprint('a')\n```\n[EDIT_FILE:a.py]"
+    second = "```python\n# [DELETE_FILE:old.py]\nprint('b')\n```\n[CREATE_FILE:b.py]"
+    full_response = f"Intro.\n{first}\nMiddle.\n{second}\nDone."
+    
+    a_start = full_response.index(first)
+    b_start = full_response.index(second)
+    delete_cue = "[DELETE_FILE:old.py]"
+    d_start = full_response.index(delete_cue)
+    replacements = [
+        # Out of order, like the edit and delete scans produce them
+        {"start": d_start, "end": d_start + len(delete_cue), "text": "[File Delete: old.py]"},
+        {"start": b_start, "end": b_start + len(second), "text": "[File Create: b.py]"},
+        {"start": a_start, "end": a_start + len(first), "text": "[File Edit: a.py]"},
+    ]
+    
+    result = AgentOrchestrator._apply_replacements(full_response, replacements)
+    
+    # Offsets after the first edit still line up, and the DELETE cue inside the second block is dropped with it
+    assert result == "Intro.\n[File Edit: a.py]\nMiddle.\n[File Create: b.py]\nDone."
@@ -5,6 +5,9 @@ Tests the regex pattern without requiring full dependency imports
 
 import re
 
+# Compiled once; the punctuation is discarded, so no capture group is needed
+_PUNCT_RE = re.compile(r'```\s*[.,;!?:]')
+
 
 def clean_message_for_display(message: str) -> str:
     """
@@ -12,8 +15,9 @@ def clean_message_for_display(message: str) -> str:
     focusing on code block punctuation cleanup
     """
     # Strip punctuation immediately after triple-backtick code blocks
-    message = re.sub(r'```\s*([.,;!?:])', r'```', message)
-    return message
+    if '```' not in message:
+        return message
+    return _PUNCT_RE.sub('```', message)
 
 
 def test_code_block_followed_by_comma():
@@ -1,7 +1,9 @@
 import pytest
 import asyncio
+from collections import deque
 from services.web_scraper import WebScraper
 
+@pytest.mark.integration
 @pytest.mark.asyncio
 async def test_scraper_fetch_real_page():
     scraper = WebScraper()
@@ -13,6 +15,7 @@ async def test_scraper_fetch_real_page():
     assert "Python" in content
     assert len(content) > 500
 
+@pytest.mark.integration
 @pytest.mark.asyncio
 async def test_scraper_search_and_deep_summarize():
     scraper = WebScraper()
@@ -25,3 +28,39 @@ async def test_scraper_search_and_deep_summarize():
     assert "detailed_content" in results
     if results["detailed_content"]:
         assert len(results["detailed_content"][0]["content"]) > 1000
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("url", ["https://github.com/org/repo", "https://example.com/page"])
+async def test_fetch_page_falls_back_to_playwright_on_error_status(url):
+    scraper = WebScraper()
+    playwright_calls = []
+
+    async def fake_httpx(url, allow_short=False):
+        return None, False  # e.g. a 403/429 or a timeout
+
+    async def fake_playwright(url):
+        playwright_calls.append(url)
+        return "rendered"
+
+    scraper._fetch_with_httpx = fake_httpx
+    scraper._fetch_with_playwright = fake_playwright
+    # example.com "usually works" with httpx; an error must still get the fallback
+    scraper._httpx_outcomes["example.com"] = deque([True] * WebScraper.HOST_HISTORY_SIZE, maxlen=WebScraper.HOST_HISTORY_SIZE)
+
+    assert await scraper.fetch_page(url) == "rendered"
+    assert playwright_calls == [url]
+
+@pytest.mark.asyncio
+async def test_fetch_page_skips_playwright_for_short_static_page():
+    scraper = WebScraper()
+
+    async def fake_httpx(url, allow_short=False):
+        return None, True  # 200 but no usable text
+
+    async def fake_playwright(url):
+        raise AssertionError("Playwright should not run for a 200 from a static host")
+
+    scraper._fetch_with_httpx = fake_httpx
+    scraper._fetch_with_playwright = fake_playwright
+
+    assert await scraper.fetch_page("https://docs.python.org/3/") is None
@@ -1,29 +1,28 @@
-import asyncio
 import re
 from typing import List, Optional
 
 class MockOrchestrator:
+    _CUE_RE = re.compile(r'\[(EDIT|CREATE)_FILE:([^\]]+)\]')
+    _BLOCK_RE = re.compile(r'```(?:\w+)?\n(.*?)\n```', re.DOTALL)
+
     def _extract_code_block(self, content: str, start_index: int = 0) -> Optional[tuple[str, int, int]]:
-        pattern = r'```(?:\w+)?\n(.*?)\n```'
-        match = re.search(pattern, content[start_index:], re.DOTALL)
+        match = self._BLOCK_RE.search(content, start_index)
         if match:
-            code_start = start_index + match.start()
-            code_end = start_index + match.end()
-            return match.group(1).strip(), code_start, code_end
+            return match.group(1).strip(), match.start(), match.end()
         return None
 
     def _extract_all_edits(self, full_response: str) -> List[dict]:
         edits = []
-        cue_pattern = r'\[(EDIT|CREATE)_FILE:([^\]]+)\]'
-        for match in re.finditer(cue_pattern, full_response):
+        cue_matches = list(self._CUE_RE.finditer(full_response))
+        for i, match in enumerate(cue_matches):
             action = match.group(1).lower()
             path = match.group(2)
             cue_end = match.end()
             extracted = self._extract_code_block(full_response, cue_end)
             if extracted:
                 code_content, block_start, block_end = extracted
-                next_cue = re.search(cue_pattern, full_response[cue_end:block_start])
-                if not next_cue:
+                next_cue = cue_matches[i + 1] if i + 1 < len(cue_matches) else None
+                if next_cue is None or next_cue.end() > block_start:
                     edits.append({
                         "action": action,
                         "path": path,
@@ -35,7 +34,7 @@ class MockOrchestrator:
                     })
         return edits
 
-async def test_multi_edit_association():
+def test_multi_edit_association():
     orchestrator = MockOrchestrator()
     
     # Message with TWO edits and some notes
@@ -74,10 +73,15 @@ Final summary.
     for e in edits:
         replacements.append({"start": e["cue_start"], "end": e["block_end"], "text": f"[File {e['action'].capitalize()}: {e['path']}]"})
     
-    replacements.sort(key=lambda x: x["start"], reverse=True)
-    clean = response
+    replacements.sort(key=lambda x: x["start"])
+    parts = []
+    pos = 0
     for r in replacements:
-        clean = clean[:r["start"]] + r["text"] + clean[r["end"]:]
+        parts.append(response[pos:r["start"]])
+        parts.append(r["text"])
+        pos = r["end"]
+    parts.append(response[pos:])
+    clean = "".join(parts)
     
     print("\nCleaned Message:")
     print(clean)
@@ -89,4 +93,4 @@ Final summary.
     print("\n✅ Verification SUCCESS")
 
 if __name__ == "__main__":
-    asyncio.run(test_multi_edit_association())
+    test_multi_edit_association()